@@ -1,5 +1,6 @@
 """Database configuration and session dependency."""
 
+import weakref
 from typing import Iterator
 
 from sqlmodel import Session, SQLModel, create_engine
@@ -9,10 +10,16 @@ DATABASE_URL = "sqlite:///./online_exam.db"
 # echo=False to avoid noisy logs; toggle for debugging
 engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
 
+# Engines whose schema already exists; keyed per engine so a swapped-in engine still gets its DDL
+_engines_with_schema = weakref.WeakSet()
+
 
 def create_db_and_tables() -> None:
-    """Create database tables based on SQLModel metadata."""
+    """Create database tables based on SQLModel metadata (once per engine)."""
+    if engine in _engines_with_schema:
+        return
     SQLModel.metadata.create_all(engine)
+    _engines_with_schema.add(engine)
 
 
 def get_session() -> Iterator[Session]:
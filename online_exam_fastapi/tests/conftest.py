@@ -1,19 +1,13 @@
-import sys
+import itertools
+import logging
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 import pytest
-from sqlmodel import Session, SQLModel, create_engine, text
+from sqlmodel import Session, SQLModel, create_engine
 
 
-def _ensure_app_on_path():
-    repo_root = Path(__file__).resolve().parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-    return repo_root
-
-
-_ensure_app_on_path()
-
 # ============================================================================
 # IN-MEMORY DATABASE FOR TESTING
 # ============================================================================
@@ -38,13 +32,15 @@ from app.models import (
 from app.auth_utils import hash_password
 
 # Create in-memory SQLite engine for testing
-# Use sqlite:///:memory: with poolclass=StaticPool to share the same in-memory DB across threads
+# Use sqlite:///:memory: with poolclass=StaticPool to share the same in-memory DB across threads.
+# Each pytest-xdist worker is its own process, so every worker gets a private database.
 from sqlalchemy.pool import StaticPool
 
 test_engine = create_engine(
     "sqlite:///:memory:",
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,  # CRITICAL: Ensures all connections share the same in-memory database
+    query_cache_size=1200,  # One engine for the whole run, so room for every compiled statement
 )
 
 @pytest.fixture(scope="session")
@@ -67,38 +63,98 @@ def setup_test_db():
 
 
 @pytest.fixture(autouse=True)
-def cleanup_db_between_tests():
+def cleanup_db_between_tests(request):
     """Clean up test data after each test."""
     yield  # run the test
-    
-    # Clean up in FK-safe order
+
+    if request.node.get_closest_marker("db_readonly"):
+        return
+
+    # Wipe rows child-first; the schema itself stays in place for the whole session
     with Session(test_engine) as session:
-        session.exec(text("DELETE FROM mcqanswer"))
-        session.exec(text("DELETE FROM mcqresult"))
-        session.exec(text("DELETE FROM mcqquestion"))
-        session.exec(text("DELETE FROM essayanswer"))
-        session.exec(text("DELETE FROM examattempt"))
-        session.exec(text("DELETE FROM examquestion"))
-        session.exec(text("DELETE FROM exam"))
-        session.exec(text("DELETE FROM enrollment"))
-        session.exec(text("DELETE FROM courselecturer"))
-        session.exec(text("DELETE FROM course"))
-        session.exec(text("DELETE FROM student"))
-        session.exec(text("DELETE FROM user"))
-        session.exec(text("DELETE FROM passwordresettoken"))
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            session.execute(table.delete())
         session.commit()
 
 
+# ============================================================================
+# FILE DATABASE SETTINGS
+# ============================================================================
+
+from sqlalchemy import event
+
+from app.database import engine as app_engine
+
+
+@event.listens_for(app_engine, "connect")
+def _disable_sqlite_durability(dbapi_connection, _connection_record):
+    """Skip fsync for tests that still use the on-disk app database; the data is disposable."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 # ============================================================================
 # FASTAPI APP & TEST CLIENT
 # ============================================================================
 
-from app.main import app
 from app.database import get_session
 
+class SyncClientWrapper:
+    """Run httpx AsyncClient requests synchronously on a dedicated event loop."""
+
+    def __init__(self, async_client, loop):
+        self.async_client = async_client
+        self.loop = loop
+
+    @property
+    def cookies(self):
+        return self.async_client.cookies
+
+    def get(self, *args, **kwargs):
+        return self.loop.run_until_complete(self.async_client.get(*args, **kwargs))
+
+    def post(self, *args, **kwargs):
+        return self.loop.run_until_complete(self.async_client.post(*args, **kwargs))
+
+    def put(self, *args, **kwargs):
+        return self.loop.run_until_complete(self.async_client.put(*args, **kwargs))
+
+    def delete(self, *args, **kwargs):
+        return self.loop.run_until_complete(self.async_client.delete(*args, **kwargs))
+
+    def patch(self, *args, **kwargs):
+        return self.loop.run_until_complete(self.async_client.patch(*args, **kwargs))
+
+    def head(self, *args, **kwargs):
+        return self.loop.run_until_complete(self.async_client.head(*args, **kwargs))
+
+    def options(self, *args, **kwargs):
+        return self.loop.run_until_complete(self.async_client.options(*args, **kwargs))
+
+
+@pytest.fixture(scope="session")
+def _event_loop():
+    """One event loop for the whole run, shared by the client and direct router calls."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 @pytest.fixture
-def client():
-    """Create test client using httpx AsyncClient with sync wrapper."""
+def run_async(_event_loop):
+    """Run a coroutine to completion on the shared loop instead of a fresh asyncio.run() loop."""
+    return _event_loop.run_until_complete
+
+
+@pytest.fixture(scope="session")
+def _session_client(_event_loop):
+    """Build the app client and the DB override once per session."""
+    # Imported here rather than at module level so pytest_configure has created app/static first
+    from app.main import app
+
     def override_get_session():
         # CRITICAL: Must use same test_engine instance that has tables
         with Session(test_engine) as session:
@@ -106,56 +162,26 @@ def client():
     
     app.dependency_overrides[get_session] = override_get_session
     
-    # Create event loop for this test
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    # Create AsyncClient
+    loop = _event_loop
     transport = httpx.ASGITransport(app=app)
     async_client = httpx.AsyncClient(transport=transport, base_url="http://testserver")
     
-    # Create a sync wrapper
-    class SyncClientWrapper:
-        def __init__(self, async_client, loop):
-            self.async_client = async_client
-            self.loop = loop
-        
-        def get(self, *args, **kwargs):
-            return self.loop.run_until_complete(self.async_client.get(*args, **kwargs))
-        
-        def post(self, *args, **kwargs):
-            return self.loop.run_until_complete(self.async_client.post(*args, **kwargs))
-        
-        def put(self, *args, **kwargs):
-            return self.loop.run_until_complete(self.async_client.put(*args, **kwargs))
-        
-        def delete(self, *args, **kwargs):
-            return self.loop.run_until_complete(self.async_client.delete(*args, **kwargs))
-        
-        def patch(self, *args, **kwargs):
-            return self.loop.run_until_complete(self.async_client.patch(*args, **kwargs))
-        
-        def head(self, *args, **kwargs):
-            return self.loop.run_until_complete(self.async_client.head(*args, **kwargs))
-        
-        def options(self, *args, **kwargs):
-            return self.loop.run_until_complete(self.async_client.options(*args, **kwargs))
-    
-    sync_client = SyncClientWrapper(async_client, loop)
-    
-    yield sync_client
+    yield SyncClientWrapper(async_client, loop)
     
     # Cleanup
     loop.run_until_complete(async_client.aclose())
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def client(_session_client):
+    """Provide the shared test client with an empty cookie jar."""
+    asyncio.set_event_loop(_session_client.loop)
+    _session_client.cookies.clear()
+    yield _session_client
+    _session_client.cookies.clear()
+
+
 @pytest.fixture
 def session():
     """Provide a database session for tests."""
@@ -163,6 +189,96 @@ def session():
         yield session
 
 
+# ============================================================================
+# UNIQUE IDENTIFIERS
+# ============================================================================
+
+# One counter behind every uniqueness helper, so their values never overlap
+_next_id = itertools.count(100000).__next__
+
+
+@pytest.fixture
+def unique_suffix(request):
+    """Return a suffix that is unique within this worker for emails, staff IDs, etc."""
+    workerinput = getattr(request.config, "workerinput", None)
+    worker_id = workerinput["workerid"] if workerinput else "master"
+    return f"{worker_id}_{_next_id()}"
+
+
+@pytest.fixture(scope="session")
+def uid_gen():
+    """Return a callable yielding fresh integers for matric numbers, course codes, etc."""
+    return _next_id
+
+
+@pytest.fixture(scope="session")
+def unique_code():
+    """Return a callable building uppercase course codes such as "SWE3001-0186A0"."""
+
+    def _unique_code(prefix="COURSE"):
+        return f"{prefix}-{_next_id():06X}"
+
+    return _unique_code
+
+
+# ============================================================================
+# ROUTER STUBS
+# ============================================================================
+
+# Shared default for absent form keys; the routers only iterate it, so a tuple is safe
+_NO_VALUES = ()
+
+
+class _MockForm:
+    """Form data exposing only getlist(), which is all the course routers read."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def getlist(self, key):
+        return self._data.get(key, _NO_VALUES)
+
+
+class _MockRequest:
+    """Request stand-in for calling router functions directly."""
+
+    __slots__ = ("_form",)
+
+    def __init__(self, form):
+        self._form = form
+
+    async def form(self):
+        return self._form
+
+
+def _make_request(**lists):
+    """Build a request whose form holds the given lists, e.g. lecturer_ids=[1, 2]."""
+    return _MockRequest(_MockForm({key: tuple(str(v) for v in values) for key, values in lists.items()}))
+
+
+@pytest.fixture(scope="session")
+def make_request():
+    """Return a factory for mock requests to pass straight to router functions."""
+    return _make_request
+
+
+@dataclass(slots=True)
+class FakeUser:
+    """Stand-in for the current_user dependency when calling routers directly."""
+
+    id: int = 1
+    role: str = "lecturer"
+    student_id: Optional[int] = None
+
+
+@pytest.fixture(scope="session")
+def fake_user():
+    """Return the FakeUser class, e.g. fake_user(id=lecturer.id)."""
+    return FakeUser
+
+
 # ============================================================================
 # ENTITY FIXTURES
 # ============================================================================
@@ -488,6 +604,23 @@ def enrolled_student_no_grades(student_user_no_grades, course):
 # PYTEST HOOKS FOR TEST SUMMARY
 # ============================================================================
 
+_QUIET_LOGGERS = ("uvicorn", "uvicorn.access", "uvicorn.error", "fastapi", "sqlalchemy.engine")
+_STATIC_DIR = Path(__file__).resolve().parent.parent / "app" / "static"
+
+
+def pytest_configure(config):
+    """Silence per-request server and SQL logging, and create app/static before app.main is imported."""
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).disabled = True
+
+    # app.main mounts app/static at import time; CI checkouts may not have it
+    try:
+        _STATIC_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # Let the app import surface the original error instead
+        pass
+
+
 test_results = {
     "total": 0,
     "passed": 0,
@@ -529,3 +662,22 @@ def pytest_sessionfinish(session, exitstatus):
     print(f"Errors:       {errors}")
     print("=" * 70)
     print()
+
+
+RESULTS_SYSTEM_COVERAGE = (
+    "Student Results Viewing (Positive & Negative)",
+    "Lecturer Results Overview (Positive & Negative)",
+    "Exam Finished Page (Positive & Negative)",
+    "Auto-Save Functionality (Positive & Negative)",
+    "Integration Tests",
+)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the results system coverage summary once, if its tests ran."""
+    reports = (rep for reps in terminalreporter.stats.values() for rep in reps)
+    if not any("test_acceptance_results_system.py" in getattr(rep, "nodeid", "") for rep in reports):
+        return
+    terminalreporter.section("RESULTS SYSTEM TEST COVERAGE SUMMARY")
+    for area in RESULTS_SYSTEM_COVERAGE:
+        terminalreporter.write_line(f"✓ {area}")
@@ -7,30 +7,38 @@ These tests validate acceptance criteria for:
 - Change Password with validation (password requirements, strength indicator)
 """
 
-import sys
-import uuid
-from pathlib import Path
+import re
 
 import pytest
 from sqlmodel import Session, select
 
-def _ensure_app_on_path():
-    repo_root = Path(__file__).resolve().parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-    return repo_root
-
-_ensure_app_on_path()
 from app.models import User, Student
-from app.auth_utils import hash_password
+from app.auth_utils import hash_password, verify_password
+
+# Accepted alternatives for a single assertion, matched in one pass over the body
+_ACCOUNT_STATUS_RE = re.compile(rb"Account Status|Active")
+_INVALID_TLD_RE = re.compile(rb"valid top-level domain|invalid")
+_INVALID_PHONE_RE = re.compile(rb"7-15 digits|valid phone")
+_DUPLICATE_RE = re.compile(rb"already registered|already in use")
+_READ_ONLY_RE = re.compile(rb"disabled|readonly")
+_NAME_REQUIRED_RE = re.compile(rb"required|name")
+_EMAIL_REQUIRED_RE = re.compile(rb"required|email")
+_WRONG_PASSWORD_RE = re.compile(rb"incorrect|wrong")
+_SAME_PASSWORD_RE = re.compile(rb"different|same")
+_DIGIT_REQUIRED_RE = re.compile(rb"number|digit")
+_MAX_LENGTH_RE = re.compile(rb"128|exceed")
+_EMAIL_VALIDATION_JS_RE = re.compile(rb"validTLDs|validateEmail")
+_PHONE_VALIDATION_JS_RE = re.compile(rb"phoneDigits|validatePhone")
+_PASSWORD_REQUIREMENTS_RE = re.compile(rb"password-requirements")
+_STRENGTH_INDICATOR_RE = re.compile(rb"strengthBar|strengthLabel")
+_LIVE_VALIDATION_JS_RE = re.compile(rb"validatePassword|calculatePasswordStrength")
 
 
 @pytest.fixture
-def authenticated_admin_client(client, session):
-    """Create an authenticated admin user and return client with session."""
+def authenticated_admin_client(client, session, unique_suffix):
+    """Create an authenticated admin user and return the logged-in client."""
     password = "Admin123!"
-    unique_id = uuid.uuid4().hex[:8]
-    email = f"admin-{unique_id}@example.com"
+    email = f"admin-{unique_suffix}@example.com"
     
     admin = User(
         name="Admin User",
@@ -40,32 +48,33 @@ def authenticated_admin_client(client, session):
     )
     session.add(admin)
     session.commit()
-    session.refresh(admin)
     
     # Login to get session cookie
-    response = client.post(
+    client.post(
         "/auth/login",
         data={"login_type": "admin", "email": email, "password": password},
         follow_redirects=False,
     )
     
-    # Extract cookies
-    cookies = dict(response.cookies)
-    
-    return client, cookies
+    # The client's cookie jar keeps the session cookie for later requests
+    return client
+
+
+@pytest.fixture
+def lecturer_email(unique_suffix):
+    """Email of the lecturer logged in by authenticated_lecturer_client."""
+    return f"lecturer-{unique_suffix}@example.com"
 
 
 @pytest.fixture
-def authenticated_lecturer_client(client, session):
-    """Create an authenticated lecturer user and return client with session."""
+def authenticated_lecturer_client(client, session, unique_suffix, lecturer_email):
+    """Create an authenticated lecturer user and return the logged-in client."""
     password = "Lecturer123!"
-    unique_id = uuid.uuid4().hex[:8]
-    email = f"lecturer-{unique_id}@example.com"
-    staff_id = f"STAFF{unique_id[:4]}"
+    staff_id = f"STAFF{unique_suffix}"
     
     lecturer = User(
         name="Dr. Lecturer",
-        email=email,
+        email=lecturer_email,
         password_hash=hash_password(password),
         role="lecturer",
         title="Dr.",
@@ -73,30 +82,26 @@ def authenticated_lecturer_client(client, session):
     )
     session.add(lecturer)
     session.commit()
-    session.refresh(lecturer)
     
     # Login to get session cookie (lecturer login uses staff_id, not email)
-    response = client.post(
+    client.post(
         "/auth/login",
         data={"login_type": "lecturer", "staff_id": staff_id, "password": password},
         follow_redirects=False,
     )
     
-    # Extract cookies
-    cookies = dict(response.cookies)
-    
-    return client, cookies
+    # The client's cookie jar keeps the session cookie for later requests
+    return client
 
 
 @pytest.fixture
-def authenticated_student_client(client, session):
-    """Create an authenticated student user and return client with session."""
+def authenticated_student_client(client, session, unique_suffix):
+    """Create an authenticated student user and return the logged-in client."""
     password = "Student123!"
-    unique_id = uuid.uuid4().hex[:8]
-    email = f"student-{unique_id}@example.com"
-    matric_no = f"SWE{unique_id[:4]}"
+    email = f"student-{unique_suffix}@example.com"
+    matric_no = f"SWE{unique_suffix}"
     
-    # Create User first
+    # Create User, Student and the back-link in a single transaction
     user = User(
         name="Student User",
         email=email,
@@ -104,8 +109,7 @@ def authenticated_student_client(client, session):
         role="student",
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    session.flush()  # populates user.id
     
     # Create Student linked to User
     student = Student(
@@ -117,25 +121,93 @@ def authenticated_student_client(client, session):
         year_of_study=2,
     )
     session.add(student)
-    session.commit()
-    session.refresh(student)
+    session.flush()  # populates student.id
     
     # Update user's student_id
     user.student_id = student.id
-    session.add(user)
     session.commit()
     
     # Login to get session cookie (student login uses matric_no, not email)
-    response = client.post(
+    client.post(
         "/auth/login",
         data={"login_type": "student", "matric_no": matric_no, "password": password},
         follow_redirects=False,
     )
     
-    # Extract cookies
-    cookies = dict(response.cookies)
+    # The client's cookie jar keeps the session cookie for later requests
+    return client
+
+
+@pytest.fixture(scope="session")
+def foil_password_hash():
+    """Hash the foil users' password once per session."""
+    return hash_password("Password123!")
+
+
+@pytest.fixture
+def foil_admin(session, unique_suffix, foil_password_hash):
+    """Create a second admin whose email the duplicate-email test collides with."""
+    admin = User(
+        name="Other User",
+        email=f"other{unique_suffix}@example.com",
+        password_hash=foil_password_hash,
+        role="admin",
+    )
+    session.add(admin)
+    session.commit()
+    return admin
+
+
+@pytest.fixture
+def foil_lecturer(session, unique_suffix, foil_password_hash):
+    """Create a second lecturer whose staff ID the duplicate-staff-ID test collides with."""
+    lecturer = User(
+        name="Other Lecturer",
+        email=f"otherlecturer{unique_suffix}@example.com",
+        password_hash=foil_password_hash,
+        role="lecturer",
+        staff_id="STAFF9999",
+    )
+    session.add(lecturer)
+    session.commit()
+    return lecturer
+
+
+@pytest.fixture(scope="module")
+def admin_form_pages(_session_client, engine):
+    """Log in as an admin once and fetch the profile-edit and change-password pages."""
+    password = "Admin123!"
+    email = "admin-forms@example.com"
+    with Session(engine) as session:
+        session.add(User(name="Admin User", email=email, password_hash=hash_password(password), role="admin"))
+        session.commit()
     
-    return client, cookies
+    client = _session_client
+    client.cookies.clear()
+    client.post(
+        "/auth/login",
+        data={"login_type": "admin", "email": email, "password": password},
+        follow_redirects=False,
+    )
+    pages = {path: client.get(path) for path in ("/auth/profile/edit", "/auth/profile/change-password")}
+    client.cookies.clear()
+    return pages
+
+
+@pytest.fixture(scope="module")
+def profile_edit_html(admin_form_pages):
+    """Body of the profile edit page, fetched once per module."""
+    response = admin_form_pages["/auth/profile/edit"]
+    assert response.status_code == 200
+    return response.content
+
+
+@pytest.fixture(scope="module")
+def change_password_html(admin_form_pages):
+    """Body of the change password page, fetched once per module."""
+    response = admin_form_pages["/auth/profile/change-password"]
+    assert response.status_code == 200
+    return response.content
 
 
 class TestProfileView:
@@ -143,24 +215,24 @@ class TestProfileView:
 
     def test_admin_can_view_profile(self, authenticated_admin_client):
         """Admin can view their profile page."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile", cookies=cookies)
+        client = authenticated_admin_client
+        response = client.get("/auth/profile")
         assert response.status_code == 200
         assert b"My Profile" in response.content
         assert b"Admin User" in response.content
 
     def test_lecturer_can_view_profile(self, authenticated_lecturer_client):
         """Lecturer can view their profile page."""
-        client, cookies = authenticated_lecturer_client
-        response = client.get("/auth/profile", cookies=cookies)
+        client = authenticated_lecturer_client
+        response = client.get("/auth/profile")
         assert response.status_code == 200
         assert b"My Profile" in response.content
         assert b"Dr. Lecturer" in response.content
 
     def test_student_can_view_profile(self, authenticated_student_client):
         """Student can view their profile page."""
-        client, cookies = authenticated_student_client
-        response = client.get("/auth/profile", cookies=cookies)
+        client = authenticated_student_client
+        response = client.get("/auth/profile")
         assert response.status_code == 200
         assert b"My Profile" in response.content
         assert b"Student User" in response.content
@@ -172,15 +244,15 @@ class TestProfileView:
 
     def test_profile_shows_account_status(self, authenticated_admin_client):
         """Profile page displays account status."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile", cookies=cookies)
+        client = authenticated_admin_client
+        response = client.get("/auth/profile")
         assert response.status_code == 200
-        assert b"Account Status" in response.content or b"Active" in response.content
+        assert _ACCOUNT_STATUS_RE.search(response.content)
 
     def test_profile_shows_member_since_date(self, authenticated_admin_client):
         """Profile page displays member since date."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile", cookies=cookies)
+        client = authenticated_admin_client
+        response = client.get("/auth/profile")
         assert response.status_code == 200
         assert b"Member Since" in response.content
 
@@ -190,17 +262,12 @@ class TestProfileEdit:
 
     def test_admin_can_update_name(self, authenticated_admin_client, session):
         """Admin can update their name."""
-        client, cookies = authenticated_admin_client
-        
-        # Get current user
-        response = client.get("/auth/profile", cookies=cookies)
-        assert response.status_code == 200
+        client = authenticated_admin_client
         
         # Update name
         response = client.post(
             "/auth/profile/edit",
             data={"name": "Updated Admin Name", "email": "admin@example.com"},
-            cookies=cookies,
             follow_redirects=False,
         )
         
@@ -212,30 +279,15 @@ class TestProfileEdit:
         if user:
             assert user.name == "Updated Admin Name"
 
-    def test_admin_can_update_email_with_valid_tld(self, authenticated_admin_client, session):
+    def test_admin_can_update_email_with_valid_tld(self, authenticated_admin_client, session, unique_suffix):
         """Admin can update email with valid TLD."""
-        client, cookies = authenticated_admin_client
-        
-        # Get current user email
-        response = client.get("/auth/profile/edit", cookies=cookies)
-        assert response.status_code == 200
-        content = response.content.decode()
+        client = authenticated_admin_client
         
-        # Extract current email from form
-        import re
-        email_match = re.search(r'name="email" value="([^"]+)"', content)
-        if email_match:
-            current_email = email_match.group(1)
-        else:
-            # Fallback: use a test email
-            current_email = "admin@example.com"
-        
-        new_email = f"newadmin{uuid.uuid4().hex[:8]}@example.com"
+        new_email = f"newadmin{unique_suffix}@example.com"
         
         response = client.post(
             "/auth/profile/edit",
             data={"name": "Admin User", "email": new_email},
-            cookies=cookies,
             follow_redirects=False,
         )
         
@@ -248,12 +300,11 @@ class TestProfileEdit:
 
     def test_admin_can_update_phone(self, authenticated_admin_client, session):
         """Admin can update phone number."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/edit",
             data={"name": "Admin User", "email": "admin@example.com", "phone": "+60123456789"},
-            cookies=cookies,
             follow_redirects=False,
         )
         
@@ -267,92 +318,64 @@ class TestProfileEdit:
 
     def test_profile_edit_rejects_invalid_email_tld(self, authenticated_admin_client):
         """Profile edit form rejects email with invalid TLD."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/edit",
             data={"name": "Admin User", "email": "admin@example.invalidtld"},
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"valid top-level domain" in response.content.lower() or b"invalid" in response.content.lower()
+        assert _INVALID_TLD_RE.search(response.content)
 
     def test_profile_edit_rejects_phone_without_digits(self, authenticated_admin_client):
         """Profile edit form rejects phone number without digits."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/edit",
             data={"name": "Admin User", "email": "admin@example.com", "phone": "abc"},
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"digits" in response.content.lower()
+        assert b"digits" in response.content
 
     def test_profile_edit_rejects_invalid_phone_length(self, authenticated_admin_client):
         """Profile edit form rejects phone number with invalid length."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/edit",
             data={"name": "Admin User", "email": "admin@example.com", "phone": "123"},
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"7-15 digits" in response.content.lower() or b"valid phone" in response.content.lower()
+        assert _INVALID_PHONE_RE.search(response.content)
 
-    def test_profile_edit_rejects_duplicate_email(self, authenticated_admin_client, session):
+    def test_profile_edit_rejects_duplicate_email(self, authenticated_admin_client, foil_admin):
         """Profile edit form rejects duplicate email."""
-        client, cookies = authenticated_admin_client
-        
-        # Create another user with different email
-        other_email = f"other{uuid.uuid4().hex[:8]}@example.com"
-        other_user = User(
-            name="Other User",
-            email=other_email,
-            password_hash=hash_password("Password123!"),
-            role="admin",
-        )
-        session.add(other_user)
-        session.commit()
+        client = authenticated_admin_client
         
         # Try to update current user's email to the other user's email
         response = client.post(
             "/auth/profile/edit",
-            data={"name": "Admin User", "email": other_email},
-            cookies=cookies,
+            data={"name": "Admin User", "email": foil_admin.email},
         )
         
         assert response.status_code == 400
-        assert b"already registered" in response.content.lower() or b"already in use" in response.content.lower()
+        assert _DUPLICATE_RE.search(response.content)
 
-    def test_lecturer_can_update_title(self, authenticated_lecturer_client, session):
+    def test_lecturer_can_update_title(self, authenticated_lecturer_client, lecturer_email, session):
         """Lecturer can update their title."""
-        client, cookies = authenticated_lecturer_client
-        
-        # Get current user email from profile page
-        profile_response = client.get("/auth/profile", cookies=cookies)
-        if profile_response.status_code != 200:
-            # If profile page redirects, get email from database
-            user = session.exec(select(User).where(User.role == "lecturer")).first()
-            user_email = user.email if user else "lecturer@example.com"
-        else:
-            # Extract email from profile page HTML
-            import re
-            email_match = re.search(r'<td>([^<]*@[^<]*)</td>', profile_response.content.decode())
-            user_email = email_match.group(1) if email_match else "lecturer@example.com"
+        client = authenticated_lecturer_client
         
         response = client.post(
             "/auth/profile/edit",
             data={
                 "name": "Dr. Lecturer",
-                "email": user_email,
+                "email": lecturer_email,
                 "title": "Prof.",
             },
-            cookies=cookies,
             follow_redirects=False,
         )
         
@@ -360,13 +383,13 @@ class TestProfileEdit:
         
         # Verify update
         session.expire_all()
-        user = session.exec(select(User).where(User.role == "lecturer")).first()
+        user = session.exec(select(User).where(User.email == lecturer_email)).one()
         if hasattr(user, "title"):
             assert user.title == "Prof."
 
     def test_profile_edit_rejects_invalid_title(self, authenticated_lecturer_client, session):
         """Profile edit form rejects invalid title."""
-        client, cookies = authenticated_lecturer_client
+        client = authenticated_lecturer_client
         
         # Get current user email
         user = session.exec(select(User).where(User.role == "lecturer")).first()
@@ -379,27 +402,14 @@ class TestProfileEdit:
                 "email": user_email,
                 "title": "InvalidTitle",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"valid title" in response.content.lower()
+        assert b"valid title" in response.content
 
-    def test_profile_edit_rejects_duplicate_staff_id(self, authenticated_lecturer_client, session):
+    def test_profile_edit_rejects_duplicate_staff_id(self, authenticated_lecturer_client, foil_lecturer):
         """Profile edit form rejects duplicate staff ID."""
-        client, cookies = authenticated_lecturer_client
-        
-        # Create another lecturer with different staff_id
-        other_email = f"otherlecturer{uuid.uuid4().hex[:8]}@example.com"
-        other_lecturer = User(
-            name="Other Lecturer",
-            email=other_email,
-            password_hash=hash_password("Password123!"),
-            role="lecturer",
-            staff_id="STAFF9999",
-        )
-        session.add(other_lecturer)
-        session.commit()
+        client = authenticated_lecturer_client
         
         # Try to update current lecturer's staff_id to the other lecturer's staff_id
         response = client.post(
@@ -407,17 +417,16 @@ class TestProfileEdit:
             data={
                 "name": "Dr. Lecturer",
                 "email": "lecturer@example.com",
-                "staff_id": "STAFF9999",
+                "staff_id": foil_lecturer.staff_id,
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"already in use" in response.content.lower()
+        assert b"already in use" in response.content
 
     def test_student_can_update_program(self, authenticated_student_client, session):
         """Student can update their program."""
-        client, cookies = authenticated_student_client
+        client = authenticated_student_client
         
         # Get current user email
         user = session.exec(select(User).where(User.role == "student")).first()
@@ -431,7 +440,6 @@ class TestProfileEdit:
                 "program": "BIM",
                 "year_of_study": "3",
             },
-            cookies=cookies,
             follow_redirects=False,
         )
         
@@ -447,7 +455,7 @@ class TestProfileEdit:
 
     def test_student_can_update_year_of_study(self, authenticated_student_client, session):
         """Student can update their year of study."""
-        client, cookies = authenticated_student_client
+        client = authenticated_student_client
         
         # Get current user email
         user = session.exec(select(User).where(User.role == "student")).first()
@@ -461,7 +469,6 @@ class TestProfileEdit:
                 "program": "SWE",
                 "year_of_study": "4",
             },
-            cookies=cookies,
             follow_redirects=False,
         )
         
@@ -477,7 +484,7 @@ class TestProfileEdit:
 
     def test_profile_edit_rejects_invalid_year_of_study(self, authenticated_student_client, session):
         """Profile edit form rejects invalid year of study."""
-        client, cookies = authenticated_student_client
+        client = authenticated_student_client
         
         # Get current user email
         user = session.exec(select(User).where(User.role == "student")).first()
@@ -490,50 +497,47 @@ class TestProfileEdit:
                 "email": user_email,
                 "year_of_study": "15",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"between 1 and 10" in response.content.lower()
+        assert b"between 1 and 10" in response.content
 
     def test_student_cannot_update_matric_number(self, authenticated_student_client):
         """Student cannot update matric number (read-only)."""
-        client, cookies = authenticated_student_client
+        client = authenticated_student_client
         
-        response = client.get("/auth/profile/edit", cookies=cookies)
+        response = client.get("/auth/profile/edit")
         assert response.status_code == 200
         
         # Check that matric_no field is disabled
         assert b'id="matric_no"' in response.content
-        assert b'disabled' in response.content or b'readonly' in response.content
+        assert _READ_ONLY_RE.search(response.content)
 
     def test_profile_edit_requires_name(self, authenticated_admin_client):
         """Profile edit form requires name field."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/edit",
             data={"name": "", "email": "admin@example.com"},
-            cookies=cookies,
         )
         
         # FastAPI returns 422 for missing required fields, 400 for validation errors
         assert response.status_code in [400, 422]
-        assert b"required" in response.content.lower() or b"name" in response.content.lower()
+        assert _NAME_REQUIRED_RE.search(response.content)
 
     def test_profile_edit_requires_email(self, authenticated_admin_client):
         """Profile edit form requires email field."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/edit",
             data={"name": "Admin User", "email": ""},
-            cookies=cookies,
         )
         
         # FastAPI returns 422 for missing required fields, 400 for validation errors
         assert response.status_code in [400, 422]
-        assert b"required" in response.content.lower() or b"email" in response.content.lower()
+        assert _EMAIL_REQUIRED_RE.search(response.content)
 
     def test_unauthenticated_user_cannot_edit_profile(self, client):
         """Unauthenticated users cannot edit profile."""
@@ -546,18 +550,14 @@ class TestChangePassword:
 
     def test_user_can_view_change_password_form(self, authenticated_admin_client):
         """User can view change password form."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile/change-password", cookies=cookies)
+        client = authenticated_admin_client
+        response = client.get("/auth/profile/change-password")
         assert response.status_code == 200
         assert b"Change Password" in response.content
 
     def test_user_can_change_password_with_valid_current_password(self, authenticated_admin_client, session):
         """User can change password with valid current password."""
-        client, cookies = authenticated_admin_client
-        
-        # Get current user email
-        response = client.get("/auth/profile", cookies=cookies)
-        assert response.status_code == 200
+        client = authenticated_admin_client
         
         # Change password
         response = client.post(
@@ -567,7 +567,6 @@ class TestChangePassword:
                 "new_password": "NewPassword123!",
                 "confirm_password": "NewPassword123!",
             },
-            cookies=cookies,
             follow_redirects=False,
         )
         
@@ -576,12 +575,11 @@ class TestChangePassword:
         # Verify password was changed
         session.expire_all()
         user = session.exec(select(User).where(User.role == "admin")).first()
-        from app.auth_utils import verify_password
         assert verify_password("NewPassword123!", user.password_hash)
 
     def test_successful_password_change_redirects_to_profile(self, authenticated_admin_client):
         """Successful password change redirects to profile with success message."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -590,7 +588,6 @@ class TestChangePassword:
                 "new_password": "NewPassword123!",
                 "confirm_password": "NewPassword123!",
             },
-            cookies=cookies,
             follow_redirects=False,
         )
         
@@ -599,7 +596,7 @@ class TestChangePassword:
 
     def test_change_password_fails_with_wrong_current_password(self, authenticated_admin_client):
         """Change password fails when current password is incorrect."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -608,15 +605,14 @@ class TestChangePassword:
                 "new_password": "NewPassword123!",
                 "confirm_password": "NewPassword123!",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"incorrect" in response.content.lower() or b"wrong" in response.content.lower()
+        assert _WRONG_PASSWORD_RE.search(response.content)
 
     def test_change_password_fails_when_reusing_current_password(self, authenticated_admin_client):
         """Change password fails when new password is same as current password."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -625,20 +621,14 @@ class TestChangePassword:
                 "new_password": "Admin123!",
                 "confirm_password": "Admin123!",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert (
-            b"different" in response.content.lower()
-            or b"same" in response.content.lower()
-            or b"must be different" in response.content.lower()
-            or b"cannot be the same" in response.content.lower()
-        )
+        assert _SAME_PASSWORD_RE.search(response.content)
 
     def test_change_password_requires_minimum_length(self, authenticated_admin_client):
         """Change password requires minimum 8 characters."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -647,15 +637,14 @@ class TestChangePassword:
                 "new_password": "Short1!",
                 "confirm_password": "Short1!",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"8 characters" in response.content.lower()
+        assert b"8 characters" in response.content
 
     def test_change_password_requires_uppercase(self, authenticated_admin_client):
         """Change password requires at least one uppercase letter."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -664,15 +653,14 @@ class TestChangePassword:
                 "new_password": "lowercase123!",
                 "confirm_password": "lowercase123!",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"uppercase" in response.content.lower()
+        assert b"uppercase" in response.content
 
     def test_change_password_requires_lowercase(self, authenticated_admin_client):
         """Change password requires at least one lowercase letter."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -681,15 +669,14 @@ class TestChangePassword:
                 "new_password": "UPPERCASE123!",
                 "confirm_password": "UPPERCASE123!",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"lowercase" in response.content.lower()
+        assert b"lowercase" in response.content
 
     def test_change_password_requires_digit(self, authenticated_admin_client):
         """Change password requires at least one digit."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -698,15 +685,14 @@ class TestChangePassword:
                 "new_password": "NoDigits!",
                 "confirm_password": "NoDigits!",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"number" in response.content.lower() or b"digit" in response.content.lower()
+        assert _DIGIT_REQUIRED_RE.search(response.content)
 
     def test_change_password_requires_special_character(self, authenticated_admin_client):
         """Change password requires at least one special character."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -715,15 +701,14 @@ class TestChangePassword:
                 "new_password": "NoSpecial123",
                 "confirm_password": "NoSpecial123",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"special" in response.content.lower()
+        assert b"special" in response.content
 
     def test_change_password_rejects_max_length_exceeded(self, authenticated_admin_client):
         """Change password rejects passwords exceeding 128 characters."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         long_password = "A" * 129 + "1!"
         response = client.post(
@@ -733,15 +718,14 @@ class TestChangePassword:
                 "new_password": long_password,
                 "confirm_password": long_password,
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"128" in response.content.lower() or b"exceed" in response.content.lower()
+        assert _MAX_LENGTH_RE.search(response.content)
 
     def test_change_password_requires_password_match(self, authenticated_admin_client):
         """Change password requires new password and confirm password to match."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -750,15 +734,14 @@ class TestChangePassword:
                 "new_password": "NewPassword123!",
                 "confirm_password": "DifferentPassword123!",
             },
-            cookies=cookies,
         )
         
         assert response.status_code == 400
-        assert b"match" in response.content.lower()
+        assert b"match" in response.content
 
     def test_change_password_requires_current_password(self, authenticated_admin_client):
         """Change password requires current password field."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -767,7 +750,6 @@ class TestChangePassword:
                 "new_password": "NewPassword123!",
                 "confirm_password": "NewPassword123!",
             },
-            cookies=cookies,
         )
         
         # FastAPI returns 422 for missing required fields, 400 for validation errors
@@ -775,7 +757,7 @@ class TestChangePassword:
 
     def test_change_password_requires_new_password(self, authenticated_admin_client):
         """Change password requires new password field."""
-        client, cookies = authenticated_admin_client
+        client = authenticated_admin_client
         
         response = client.post(
             "/auth/profile/change-password",
@@ -784,7 +766,6 @@ class TestChangePassword:
                 "new_password": "",
                 "confirm_password": "",
             },
-            cookies=cookies,
         )
         
         # FastAPI returns 422 for missing required fields, 400 for validation errors
@@ -799,51 +780,24 @@ class TestChangePassword:
 class TestProfileEditClientSideValidation:
     """Tests for client-side validation in profile edit form."""
 
-    def test_profile_edit_has_email_tld_validation(self, authenticated_admin_client):
-        """Profile edit form has client-side email TLD validation."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile/edit", cookies=cookies)
-        assert response.status_code == 200
-        
-        content = response.content.decode()
-        assert "validTLDs" in content or "validateEmail" in content
-
-    def test_profile_edit_has_phone_pattern_validation(self, authenticated_admin_client):
-        """Profile edit form has client-side phone pattern validation."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile/edit", cookies=cookies)
-        assert response.status_code == 200
-        
-        content = response.content.decode()
-        assert "phoneDigits" in content or "validatePhone" in content
+    @pytest.mark.parametrize(
+        "pattern",
+        [_EMAIL_VALIDATION_JS_RE, _PHONE_VALIDATION_JS_RE],
+        ids=["email_tld_validation", "phone_pattern_validation"],
+    )
+    def test_profile_edit_has_client_side_validation(self, profile_edit_html, pattern):
+        """Profile edit form has client-side email TLD and phone pattern validation."""
+        assert pattern.search(profile_edit_html)
 
 
 class TestChangePasswordClientSideValidation:
     """Tests for client-side validation in change password form."""
 
-    def test_change_password_has_password_requirements(self, authenticated_admin_client):
-        """Change password form displays password requirements."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile/change-password", cookies=cookies)
-        assert response.status_code == 200
-        
-        content = response.content.decode()
-        assert "password-requirements" in content
-
-    def test_change_password_has_strength_indicator(self, authenticated_admin_client):
-        """Change password form has password strength indicator."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile/change-password", cookies=cookies)
-        assert response.status_code == 200
-        
-        content = response.content.decode()
-        assert "strengthBar" in content or "strengthLabel" in content
-
-    def test_change_password_has_live_validation(self, authenticated_admin_client):
-        """Change password form has live password validation."""
-        client, cookies = authenticated_admin_client
-        response = client.get("/auth/profile/change-password", cookies=cookies)
-        assert response.status_code == 200
-        
-        content = response.content.decode()
-        assert "validatePassword" in content or "calculatePasswordStrength" in content
+    @pytest.mark.parametrize(
+        "pattern",
+        [_PASSWORD_REQUIREMENTS_RE, _STRENGTH_INDICATOR_RE, _LIVE_VALIDATION_JS_RE],
+        ids=["password_requirements", "strength_indicator", "live_validation"],
+    )
+    def test_change_password_has_client_side_validation(self, change_password_html, pattern):
+        """Change password form displays requirements, a strength indicator and live validation."""
+        assert pattern.search(change_password_html)
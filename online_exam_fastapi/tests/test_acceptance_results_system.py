@@ -10,20 +10,13 @@ Tests cover:
 - Grade display after exam submission
 """
 
-import sys
-from pathlib import Path
+import json
+
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
-# Ensure app is on path
-repo_root = Path(__file__).resolve().parent.parent
-if str(repo_root) not in sys.path:
-    sys.path.insert(0, str(repo_root))
-
-from fastapi.testclient import TestClient
-from app.main import app
-from app.database import engine, create_db_and_tables
 from app.models import (
     User,
     Student,
@@ -32,146 +25,77 @@ from app.models import (
     MCQQuestion,
     MCQAnswer,
     MCQResult,
-    ExamQuestion,  # Essay questions
-    EssayAnswer,
-    ExamAttempt,
-    Enrollment,
-    CourseLecturer,
 )
 
+_JSON_HEADERS = {"content-type": "application/json"}
 
-@pytest.fixture(scope="function")
-def session():
-    """Create a new database session for each test."""
-    create_db_and_tables()
-    with Session(engine) as session:
-        yield session
-        # Cleanup after each test
-        session.rollback()
-
-
-@pytest.fixture(scope="function")
-def test_data(session: Session):
-    """Create test data for results system tests."""
-    import random
-    import time
-    unique_id = int(time.time() * 1000) % 1000000  # More unique ID
-    
-    # Create users
-    student_user = User(
-        username=f"stud_res_{unique_id}",
-        name="Test Student User",
-        email=f"stud_res_{unique_id}@test.com",
-        password_hash="hashed",
-        role="student",
-    )
-    lecturer_user = User(
-        username=f"lect_res_{unique_id}",
-        name="Test Lecturer User",
-        email=f"lect_res_{unique_id}@test.com",
-        password_hash="hashed",
-        role="lecturer",
-    )
-    session.add(student_user)
-    session.add(lecturer_user)
-    session.commit()
-    session.refresh(student_user)
-    session.refresh(lecturer_user)
-
-    # Create student
-    student = Student(
-        id=student_user.id,
-        name="Test Student",
-        matric_no="A0001R",
-        email=student_user.email,
-    )
-    session.add(student)
-    session.commit()
-    session.refresh(student)
+# Statements built once; SQLAlchemy's compiled cache then reuses their SQL
+_USER_ID_INSERT = insert(User).returning(User.id, sort_by_parameter_order=True)
+_STUDENT_INSERT = insert(Student)
+_MCQ_RESULT_INSERT = insert(MCQResult)
+_COURSE_ID_INSERT = insert(Course).returning(Course.id)
+_EXAM_ID_INSERT = insert(Exam).returning(Exam.id)
 
-    # Create course
-    course = Course(
-        code="CS101",
-        name="Introduction to Testing",
-        description="Test course for results",
-    )
-    session.add(course)
-    session.commit()
-    session.refresh(course)
 
-    # Link lecturer to course
-    course_lecturer = CourseLecturer(
-        course_id=course.id, lecturer_id=lecturer_user.id
-    )
-    session.add(course_lecturer)
+def _autosave_payload(student_id, answers) -> bytes:
+    """Serialize an autosave request body once so it can be posted as raw content."""
+    return json.dumps({"student_id": student_id, "answers": answers}).encode()
 
-    # Enroll student in course
-    enrollment = Enrollment(student_id=student.id, course_id=course.id)
-    session.add(enrollment)
-    session.commit()
 
-    # Create exam
-    exam = Exam(
-        title="Test Exam",
-        subject="Testing",
-        course_id=course.id,
-        duration_minutes=60,
-        start_time=datetime.now() - timedelta(hours=2),
-        end_time=datetime.now() + timedelta(hours=2),
-        status="scheduled",
-    )
-    session.add(exam)
-    session.commit()
-    session.refresh(exam)
+def _make_student_exam(session: Session, uid: int):
+    """Create and commit a student user, student, course and exam; return all four."""
+    student_user = User(name=f"S{uid}", email=f"s{uid}@t.com", password_hash="h", role="student")
+    course = Course(code=f"C{uid}", name="Test", description="Test")
+    session.add_all([student_user, course])
+    session.flush()
 
-    # Create MCQ questions
-    for i in range(5):
-        question = MCQQuestion(
-            exam_id=exam.id,
-            question_text=f"Question {i+1}",
-            option_a=f"Option A{i+1}",
-            option_b=f"Option B{i+1}",
-            option_c=f"Option C{i+1}",
-            option_d=f"Option D{i+1}",
-            correct_option="a",
-        )
-        session.add(question)
+    student = Student(id=student_user.id, name="Test", matric_no=f"A{uid}", email=student_user.email)
+    exam = Exam(title="Test", subject="Test", course_id=course.id, duration_minutes=60, status="scheduled")
+    session.add_all([student, exam])
     session.commit()
+    return student_user, student, course, exam
+
 
-    # Create MCQ result
-    result = MCQResult(
-        exam_id=exam.id,
-        student_id=student.id,
-        score=8,
-        total_questions=5,
-        graded_at=datetime.now(),
+def _insert_course_exam(session: Session, uid: int):
+    """Insert a course and a scheduled exam in it with Core; return their ids."""
+    course_id = session.scalar(
+        _COURSE_ID_INSERT,
+        {"code": f"C{uid}", "name": "Test Course", "description": "Test"},
+    )
+    exam_id = session.scalar(
+        _EXAM_ID_INSERT,
+        {
+            "title": "Test Exam",
+            "subject": "Test",
+            "course_id": course_id,
+            "duration_minutes": 60,
+            "status": "scheduled",
+        },
     )
-    session.add(result)
     session.commit()
+    return course_id, exam_id
 
-    return {
-        "student_user": student_user,
-        "lecturer_user": lecturer_user,
-        "student": student,
-        "course": course,
-        "exam": exam,
-        "result": result,
-    }
+
+@pytest.fixture
+def session(engine):
+    """Session that keeps loaded attributes after commit, so reading ids needs no SELECT."""
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
 
 
 class TestStudentResultsPositive:
     """Positive test cases for student results viewing."""
 
-    def test_student_can_view_own_results(self, client: TestClient, session: Session):
+    def test_student_can_view_own_results(
+        self, client, session: Session, uid_gen
+    ):
         """Test that a student can view their own exam results."""
         # Create unique test data for this test
-        import time
-        uid = int(time.time() * 1000000) % 10000000
+        uid = uid_gen()
         
         student_user = User(name=f"Student{uid}", email=f"s{uid}@t.com", password_hash="h", role="student")
         session.add(student_user)
-        session.commit()
-        session.refresh(student_user)
+        session.flush()
         
         student = Student(user_id=student_user.id, name="Test Student", matric_no=f"A{uid}", email=student_user.email)
         session.add(student)
@@ -180,19 +104,16 @@ class TestStudentResultsPositive:
         response = client.get(f"/exams/results/student/{student.id}")
 
         assert response.status_code in [200, 303]
-        print("✓ Student can view own results")
 
     def test_student_results_shows_correct_statistics(
-        self, client: TestClient, session: Session
+        self, client, session: Session, uid_gen
     ):
         """Test that student results page displays correct statistics."""
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 1
+        uid = uid_gen()
         
         student_user = User(username=f"s{uid}", name=f"Student{uid}", email=f"s{uid}@t.com", password_hash="h", role="student")
         session.add(student_user)
-        session.commit()
-        session.refresh(student_user)
+        session.flush()
         
         student = Student(id=student_user.id, name="Test Student", matric_no=f"A{uid}", email=student_user.email)
         session.add(student)
@@ -201,17 +122,16 @@ class TestStudentResultsPositive:
         response = client.get(f"/exams/results/student/{student.id}")
 
         assert response.status_code in [200, 303]
-        print("✓ Student results show correct statistics")
 
-    def test_student_results_shows_percentage(self, client: TestClient, session: Session):
+    def test_student_results_shows_percentage(
+        self, client, session: Session, uid_gen
+    ):
         """Test that results display percentage correctly."""
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 2
+        uid = uid_gen()
         
         student_user = User(username=f"s{uid}", name=f"Student{uid}", email=f"s{uid}@t.com", password_hash="h", role="student")
         session.add(student_user)
-        session.commit()
-        session.refresh(student_user)
+        session.flush()
         
         student = Student(id=student_user.id, name="Test Student", matric_no=f"A{uid}", email=student_user.email)
         session.add(student)
@@ -220,30 +140,27 @@ class TestStudentResultsPositive:
         response = client.get(f"/exams/results/student/{student.id}")
 
         assert response.status_code == 200
-        print("✓ Student results show percentage")
 
     def test_student_results_page_loads_with_no_results(
-        self, client: TestClient, session: Session
+        self, client, session: Session, uid_gen
     ):
         """Test that results page loads even when student has no results."""
-        import time
-        unique_suffix = int(time.time() * 1000) % 1000000
-        
+        uid = uid_gen()
+
         # Create new student with no results
         new_user = User(
             name="No Results User",
-            email=f"no_results_{unique_suffix}@test.com",
+            email=f"no_results_{uid}@test.com",
             password_hash="hashed",
             role="student",
         )
         session.add(new_user)
-        session.commit()
-        session.refresh(new_user)
+        session.flush()
 
         new_student = Student(
             id=new_user.id,
             name="No Results Student",
-            matric_no=f"A{unique_suffix}R",
+            matric_no=f"A{uid}R",
             email=new_user.email,
         )
         session.add(new_student)
@@ -252,385 +169,302 @@ class TestStudentResultsPositive:
         response = client.get(f"/exams/results/student/{new_student.id}")
 
         assert response.status_code in [200, 303]
-        print("✓ Results page loads with no results")
 
 
+@pytest.mark.db_readonly
 class TestStudentResultsNegative:
     """Negative test cases for student results viewing."""
 
-    def test_student_results_with_invalid_id(self, client: TestClient):
-        """Test accessing results with non-existent student ID."""
-        invalid_id = 99999
-
-        response = client.get(f"/exams/results/student/{invalid_id}")
-
-        assert response.status_code == 200  # Page loads but shows no student
-        print("✓ Handles invalid student ID gracefully")
-
-    def test_student_results_with_negative_id(self, client: TestClient):
-        """Test accessing results with negative student ID."""
-        response = client.get("/exams/results/student/-1")
-
-        # Should handle gracefully
-        assert response.status_code in [200, 404, 422]
-        print("✓ Handles negative student ID")
-
-    def test_student_results_with_string_id(self, client: TestClient):
-        """Test accessing results with string instead of integer ID."""
-        response = client.get("/exams/results/student/invalid")
+    @pytest.mark.parametrize(
+        "student_id, expected",
+        [
+            ("99999", {200}),  # Page loads but shows no student
+            ("-1", {200, 404, 422}),
+            ("invalid", {422}),  # FastAPI path validation
+        ],
+        ids=["nonexistent", "negative", "string"],
+    )
+    def test_student_results_id_validation(
+        self, client, student_id, expected
+    ):
+        """Test accessing student results with invalid IDs."""
+        response = client.get(f"/exams/results/student/{student_id}")
 
-        # FastAPI should return 422 for validation error
-        assert response.status_code == 422
-        print("✓ Validates student ID type")
+        assert response.status_code in expected
 
 
 class TestLecturerResultsPositive:
     """Positive test cases for lecturer results overview."""
 
-    def test_lecturer_can_view_results_overview(self, client: TestClient):
+    @pytest.mark.db_readonly
+    def test_lecturer_can_view_results_overview(self, client):
         """Test that lecturer can view results overview."""
         response = client.get("/exams/results/lecturer")
 
         assert response.status_code in [200, 303]
-        print("✓ Lecturer can view results overview")
 
+    @pytest.mark.db_readonly
     def test_lecturer_results_shows_course_statistics(
-        self, client: TestClient
+        self, client
     ):
         """Test that lecturer overview shows course statistics."""
         response = client.get("/exams/results/lecturer")
 
         assert response.status_code in [200, 303]
-        print("✓ Lecturer overview shows statistics")
 
-    def test_lecturer_can_view_course_results(self, client: TestClient, session: Session):
+    def test_lecturer_can_view_course_results(
+        self, client, session: Session, uid_gen
+    ):
         """Test that lecturer can view results for specific course."""
         # Create minimal course
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 100
-        course = Course(code=f"C{uid}", name="Test Course", description="Test")
-        session.add(course)
+        course_id = session.scalar(
+            _COURSE_ID_INSERT,
+            {"code": f"C{uid_gen()}", "name": "Test Course", "description": "Test"},
+        )
         session.commit()
 
-        response = client.get(f"/exams/results/course/{course.id}")
+        response = client.get(f"/exams/results/course/{course_id}")
 
         assert response.status_code in [200, 303, 404]  # May not have results or need login
-        print("✓ Lecturer can view course results")
 
-    def test_lecturer_can_view_exam_details(self, client: TestClient, session: Session):
+    def test_lecturer_can_view_exam_details(
+        self, client, session: Session, uid_gen
+    ):
         """Test that lecturer can view detailed exam results."""
         # Create minimal exam
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 200
-        course = Course(code=f"C{uid}", name="Test Course", description="Test")
-        session.add(course)
-        session.commit()
-        
-        exam = Exam(title="Test Exam", subject="Test", course_id=course.id, duration_minutes=60, status="scheduled")
-        session.add(exam)
-        session.commit()
+        _, exam_id = _insert_course_exam(session, uid_gen())
 
-        response = client.get(f"/exams/results/exam/{exam.id}")
+        response = client.get(f"/exams/results/exam/{exam_id}")
 
         assert response.status_code in [200, 303, 404]
-        print("✓ Lecturer can view exam details")
 
     def test_exam_details_shows_student_rankings(
-        self, client: TestClient, session: Session
+        self, client, session: Session, uid_gen
     ):
         """Test that exam details show student rankings."""
         # Create minimal exam
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 300
-        course = Course(code=f"C{uid}", name="Test Course", description="Test")
-        session.add(course)
-        session.commit()
-        
-        exam = Exam(title="Test Exam", subject="Test", course_id=course.id, duration_minutes=60, status="scheduled")
-        session.add(exam)
-        session.commit()
+        _, exam_id = _insert_course_exam(session, uid_gen())
 
-        response = client.get(f"/exams/results/exam/{exam.id}")
+        response = client.get(f"/exams/results/exam/{exam_id}")
 
         assert response.status_code in [200, 303, 404]
-        print("✓ Exam details show rankings")
 
 
+@pytest.mark.db_readonly
 class TestLecturerResultsNegative:
     """Negative test cases for lecturer results."""
 
-    def test_course_results_with_invalid_id(self, client: TestClient):
-        """Test accessing course results with non-existent course ID."""
-        invalid_id = 99999
-
-        response = client.get(f"/exams/results/course/{invalid_id}")
-
-        # May return 200 with empty data or 404, or need login (303)
-        assert response.status_code in [200, 303, 404]
-        print("✓ Handles invalid course ID")
-
-    def test_exam_results_with_invalid_id(self, client: TestClient):
-        """Test accessing exam results with non-existent exam ID."""
-        invalid_id = 99999
-
-        response = client.get(f"/exams/results/exam/{invalid_id}")
-
-        # May return 200 with empty data or 404, or need login (303)
-        assert response.status_code in [200, 303, 404]
-        print("✓ Handles invalid exam ID")
-
-    def test_course_results_with_string_id(self, client: TestClient):
-        """Test accessing course results with string ID."""
-        response = client.get("/exams/results/course/invalid")
-
-        # FastAPI validation should handle this - 303 if need login, 200/404/422 depending on implementation
-        assert response.status_code in [200, 303, 404, 422]
-        print("✓ Validates course ID type")
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/exams/results/course/99999", {200, 303, 404}),
+            ("/exams/results/course/invalid", {200, 303, 404, 422}),
+            ("/exams/results/exam/99999", {200, 303, 404}),
+            ("/exams/results/exam/-1", {200, 303, 404}),
+        ],
+        ids=["course-nonexistent", "course-string", "exam-nonexistent", "exam-negative"],
+    )
+    def test_results_id_validation(self, client, path, expected):
+        """Test accessing course/exam results with invalid IDs.
 
-    def test_exam_results_with_negative_id(self, client: TestClient):
-        """Test accessing exam results with negative ID."""
-        response = client.get("/exams/results/exam/-1")
+        May return 200 with empty data, 303 if login is needed, 404, or 422
+        for a non-integer ID.
+        """
+        response = client.get(path)
 
-        # May return 200 with empty data, 303 for redirect, or 404
-        assert response.status_code in [200, 303, 404]
-        print("✓ Handles negative exam ID")
+        assert response.status_code in expected
 
 
+@pytest.mark.db_readonly
 class TestExamFinishedPagePositive:
     """Positive test cases for exam finished page."""
 
-    def test_exam_finished_page_displays_score(self, client: TestClient):
-        """Test that exam finished page displays score correctly."""
-        response = client.get("/exams/exam_finished?score=8&total=10")
-
-        assert response.status_code == 200
-        assert b"8" in response.content
-        assert b"10" in response.content
-        print("✓ Exam finished page displays score")
-
-    def test_exam_finished_page_without_score(self, client: TestClient):
-        """Test that exam finished page loads without score parameters."""
-        response = client.get("/exams/exam_finished")
-
-        assert response.status_code == 200
-        print("✓ Exam finished page loads without score")
-
-    def test_exam_finished_page_with_perfect_score(self, client: TestClient):
-        """Test exam finished page with perfect score."""
-        response = client.get("/exams/exam_finished?score=10&total=10")
-
-        assert response.status_code == 200
-        assert b"10" in response.content
-        print("✓ Displays perfect score correctly")
-
-    def test_exam_finished_page_with_zero_score(self, client: TestClient):
-        """Test exam finished page with zero score."""
-        response = client.get("/exams/exam_finished?score=0&total=10")
+    @pytest.mark.parametrize(
+        "query, needles",
+        [
+            ("?score=8&total=10", (b"8", b"10")),
+            ("", ()),
+            ("?score=10&total=10", (b"10",)),
+            ("?score=0&total=10", (b"0",)),
+        ],
+        ids=["score", "no-score", "perfect-score", "zero-score"],
+    )
+    def test_exam_finished_page_displays_score(
+        self, client, query, needles
+    ):
+        """Test that exam finished page loads and displays the given score."""
+        response = client.get(f"/exams/exam_finished{query}")
 
         assert response.status_code == 200
-        assert b"0" in response.content
-        print("✓ Displays zero score correctly")
+        for needle in needles:
+            assert needle in response.content
 
 
+@pytest.mark.db_readonly
 class TestExamFinishedPageNegative:
     """Negative test cases for exam finished page."""
 
-    def test_exam_finished_with_negative_score(self, client: TestClient):
-        """Test exam finished page with negative score."""
-        response = client.get("/exams/exam_finished?score=-5&total=10")
-
-        # Should still load (might show negative)
-        assert response.status_code == 200
-        print("✓ Handles negative score")
-
-    def test_exam_finished_with_score_exceeding_total(self, client: TestClient):
-        """Test exam finished page when score exceeds total."""
-        response = client.get("/exams/exam_finished?score=15&total=10")
-
-        assert response.status_code == 200
-        print("✓ Handles score exceeding total")
-
-    def test_exam_finished_with_invalid_score_type(self, client: TestClient):
-        """Test exam finished page with non-numeric score."""
-        response = client.get("/exams/exam_finished?score=invalid&total=10")
-
-        # FastAPI validation should handle this
-        assert response.status_code == 422
-        print("✓ Validates score parameter type")
-
-    def test_exam_finished_with_zero_total(self, client: TestClient):
-        """Test exam finished page with zero total questions."""
-        response = client.get("/exams/exam_finished?score=0&total=0")
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("score=-5&total=10", {200}),  # Should still load (might show negative)
+            ("score=15&total=10", {200}),
+            ("score=invalid&total=10", {422}),  # FastAPI query validation
+            # Division by zero may be handled (200) or surface as a 500
+            ("score=0&total=0", {200, 500}),
+        ],
+        ids=["negative-score", "score-exceeds-total", "non-numeric-score", "zero-total"],
+    )
+    def test_exam_finished_with_unusual_scores(
+        self, client, query, expected
+    ):
+        """Test exam finished page with out-of-range or malformed scores."""
+        response = client.get(f"/exams/exam_finished?{query}")
 
-        # Should handle division by zero gracefully - might return 200 with error handling or 500
-        assert response.status_code in [200, 500]
-        print("✓ Handles zero total gracefully")
+        assert response.status_code in expected
 
 
 class TestAutoSaveFunctionalityPositive:
     """Positive test cases for auto-save functionality."""
 
-    def test_mcq_autosave_endpoint_exists(self, client: TestClient, session: Session):
+    def test_mcq_autosave_endpoint_exists(
+        self, client, session: Session, uid_gen
+    ):
         """Test that MCQ auto-save endpoint is accessible."""
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 400
-        
-        student_user = User(username=f"s{uid}", name=f"S{uid}", email=f"s{uid}@t.com", password_hash="h", role="student")
-        session.add(student_user)
-        session.commit()
-        
-        student = Student(id=student_user.id, name="Test", matric_no=f"A{uid}", email=student_user.email)
-        course = Course(code=f"C{uid}", name="Test", description="Test")
-        session.add_all([student, course])
-        session.commit()
-        
-        exam = Exam(title="Test", subject="Test", course_id=course.id, duration_minutes=60, status="scheduled")
-        session.add(exam)
-        session.commit()
+        _, student, _, exam = _make_student_exam(session, uid_gen())
 
         # Post auto-save data
         response = client.post(
             f"/exams/{exam.id}/autosave",
-            json={"student_id": student.id, "answers": {}},
+            content=_autosave_payload(student.id, {}),
+            headers=_JSON_HEADERS,
         )
 
         # Should accept the request (200 or 201 or 404 if endpoint doesn't exist yet)
         assert response.status_code in [200, 201, 404, 422]
-        print("✓ MCQ auto-save endpoint accessible")
 
     def test_mcq_autosave_saves_answers(
-        self, client: TestClient, session: Session
+        self, client, session: Session, uid_gen
     ):
         """Test that MCQ auto-save actually saves answers to database."""
-        print("✓ MCQ auto-save persists to database")
+        _, student, _, exam = _make_student_exam(session, uid_gen())
+        question = MCQQuestion(
+            exam_id=exam.id,
+            question_text="Question 1",
+            option_a="Option A",
+            option_b="Option B",
+            option_c="Option C",
+            option_d="Option D",
+            correct_option="a",
+        )
+        session.add(question)
+        session.commit()
+
+        response = client.post(
+            f"/exams/{exam.id}/autosave",
+            content=_autosave_payload(student.id, {str(question.id): "b"}),
+            headers=_JSON_HEADERS,
+        )
+
+        assert response.status_code == 200
+        answer = session.exec(
+            select(MCQAnswer).where(
+                MCQAnswer.student_id == student.id,
+                MCQAnswer.question_id == question.id,
+            )
+        ).first()
+        assert answer is not None
+        assert answer.selected_option == "b"
 
     def test_essay_autosave_endpoint_exists(
-        self, client: TestClient, session: Session
+        self, client, session: Session, uid_gen
     ):
         """Test that essay auto-save endpoint is accessible."""
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 500
-        
-        student_user = User(username=f"s{uid}", name=f"S{uid}", email=f"s{uid}@t.com", password_hash="h", role="student")
-        session.add(student_user)
-        session.commit()
-        
-        student = Student(id=student_user.id, name="Test", matric_no=f"A{uid}", email=student_user.email)
-        course = Course(code=f"C{uid}", name="Test", description="Test")
-        session.add_all([student, course])
-        session.commit()
-        
-        exam = Exam(title="Test", subject="Test", course_id=course.id, duration_minutes=60, status="scheduled")
-        session.add(exam)
-        session.commit()
+        _, student, _, exam = _make_student_exam(session, uid_gen())
 
         response = client.post(
             f"/essay/exam/{exam.id}/autosave",
-            json={
-                "student_id": student.id,
-                "answers": {},
-            },
+            content=_autosave_payload(student.id, {}),
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code in [200, 201, 404, 422]
-        print("✓ Essay auto-save endpoint accessible")
 
 
 class TestAutoSaveFunctionalityNegative:
     """Negative test cases for auto-save functionality."""
 
-    def test_mcq_autosave_with_invalid_exam_id(self, client: TestClient):
+    def test_mcq_autosave_with_invalid_exam_id(self, client):
         """Test MCQ auto-save with non-existent exam ID."""
         invalid_exam_id = 99999
 
         response = client.post(
             f"/exams/{invalid_exam_id}/autosave",
-            json={"student_id": 1, "answers": {"1": "a"}},
+            content=_autosave_payload(1, {"1": "a"}),
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code in [200, 404, 422, 500]
-        print("✓ MCQ auto-save rejects invalid exam ID")
 
-    def test_mcq_autosave_with_invalid_student_id(self, client: TestClient):
+    def test_mcq_autosave_with_invalid_student_id(self, client):
         """Test MCQ auto-save with non-existent student ID."""
         response = client.post(
             f"/exams/1/autosave",
-            json={"student_id": 99999, "answers": {"1": "a"}},
+            content=_autosave_payload(99999, {"1": "a"}),
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code in [200, 404, 422, 500]
-        print("✓ MCQ auto-save rejects invalid student ID")
 
-    def test_mcq_autosave_with_empty_answers(self, client: TestClient):
+    def test_mcq_autosave_with_empty_answers(self, client):
         """Test MCQ auto-save with empty answers."""
         response = client.post(
             f"/exams/1/autosave",
-            json={"student_id": 1, "answers": {}},
+            content=_autosave_payload(1, {}),
+            headers=_JSON_HEADERS,
         )
 
         # Should accept empty answers (student might not have answered yet)
         assert response.status_code in [200, 201, 404, 422, 500]
-        print("✓ MCQ auto-save handles empty answers")
 
     def test_mcq_autosave_with_invalid_answer_format(
-        self, client: TestClient
+        self, client
     ):
         """Test MCQ auto-save with invalid answer format."""
         try:
             response = client.post(
                 f"/exams/1/autosave",
-                json={
-                    "student_id": 1,
-                    "answers": "invalid_format",  # Should be dict
-                },
+                content=_autosave_payload(1, "invalid_format"),  # answers should be a dict
+                headers=_JSON_HEADERS,
             )
 
             assert response.status_code == 422
-            print("✓ MCQ auto-save validates answer format")
         except AttributeError:
             # Expected: endpoint should raise AttributeError for invalid format
-            print("✓ MCQ auto-save validates answer format")
             pass
 
     def test_essay_autosave_with_no_attempt(
-        self, client: TestClient
+        self, client
     ):
         """Test essay auto-save when no exam attempt exists."""
         response = client.post(
             f"/essay/exam/1/autosave",
-            json={
-                "student_id": 1,
-                "answers": {"1": "Test answer"},
-            },
+            content=_autosave_payload(1, {"1": "Test answer"}),
+            headers=_JSON_HEADERS,
         )
 
         # Should handle gracefully (might create attempt or return error)
         assert response.status_code in [200, 201, 404, 422, 500]
-        print("✓ Essay auto-save handles missing attempt")
 
 
 class TestResultsIntegration:
     """Integration tests for complete results workflow."""
 
     def test_complete_exam_to_results_workflow(
-        self, client: TestClient, session: Session
+        self, client, session: Session, uid_gen
     ):
         """Test complete workflow from taking exam to viewing results."""
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 600
-        
-        student_user = User(username=f"s{uid}", name=f"S{uid}", email=f"s{uid}@t.com", password_hash="h", role="student")
-        session.add(student_user)
-        session.commit()
-        
-        student = Student(id=student_user.id, name="Test", matric_no=f"A{uid}", email=student_user.email)
-        course = Course(code=f"C{uid}", name="Test", description="Test")
-        session.add_all([student, course])
-        session.commit()
-        
-        exam = Exam(title="Test", subject="Test", course_id=course.id, duration_minutes=60, status="scheduled")
-        session.add(exam)
-        session.commit()
+        _, student, course, exam = _make_student_exam(session, uid_gen())
 
         # 1. Verify student can view their results
         response = client.get(f"/exams/results/student/{student.id}")
@@ -644,72 +478,67 @@ class TestResultsIntegration:
         response = client.get(f"/exams/results/exam/{exam.id}")
         assert response.status_code in [200, 303, 404]
 
-        print("✓ Complete exam to results workflow works")
 
     def test_multiple_students_results_ranking(
-        self, client: TestClient, session: Session
+        self, client, session: Session, uid_gen
     ):
         """Test that multiple students are ranked correctly."""
-        import time
-        uid = int(time.time() * 1000000) % 10000000 + 700
+        uid = uid_gen()
 
         course = Course(code=f"C{uid}", name="Test", description="Test")
         session.add(course)
-        session.commit()
-        
+        session.flush()
+
         exam = Exam(title="Test", subject="Test", course_id=course.id, duration_minutes=60, status="scheduled")
         session.add(exam)
-        session.commit()
+        session.flush()  # populates exam.id
+
+        # Create additional students with different scores; Core inserts
+        # skip per-object unit-of-work bookkeeping for these plain rows
+        emails = [f"r{uid}_{i}@test.com" for i in range(3)]
+        user_ids = session.scalars(
+            _USER_ID_INSERT,
+            [
+                {
+                    "name": f"Rank User {i}",
+                    "email": email,
+                    "password_hash": "hashed",
+                    "role": "student",
+                }
+                for i, email in enumerate(emails)
+            ],
+        ).all()
+        session.execute(
+            _STUDENT_INSERT,
+            [
+                {
+                    "id": user_id,
+                    "name": f"Rank Student {i}",
+                    "matric_no": f"A{uid}{i}R",
+                    "email": email,
+                }
+                for i, (user_id, email) in enumerate(zip(user_ids, emails))
+            ],
+        )
 
-        # Create additional students with different scores
-        for i in range(3):
-            user = User(
-                username=f"s{uid}_{i}",
-                name=f"Rank User {i}",
-                email=f"r{uid}_{i}@test.com",
-                password_hash="hashed",
-                role="student",
-            )
-            session.add(user)
-            session.commit()
-            session.refresh(user)
-
-            student = Student(
-                id=user.id,
-                name=f"Rank Student {i}",
-                matric_no=f"A{uid}{i}R",
-                email=user.email,
-            )
-            session.add(student)
-            session.commit()
-
-            # Create result with different score
-            result = MCQResult(
-                exam_id=exam.id,
-                student_id=student.id,
-                score=6 + i,  # Scores: 6, 7, 8
-                total_questions=5,
-                graded_at=datetime.now(),
-            )
-            session.add(result)
+        # Create results with different scores
+        graded_at = datetime.now()
+        session.execute(
+            _MCQ_RESULT_INSERT,
+            [
+                {
+                    "exam_id": exam.id,
+                    "student_id": user_id,
+                    "score": 6 + i,  # Scores: 6, 7, 8
+                    "total_questions": 5,
+                    "graded_at": graded_at,
+                }
+                for i, user_id in enumerate(user_ids)
+            ],
+        )
         session.commit()
 
         # View exam results
         response = client.get(f"/exams/results/exam/{exam.id}")
 
         assert response.status_code in [200, 303, 404]
-        print("✓ Multiple students ranked correctly")
-
-
-# Summary message for test run
-def test_results_system_summary():
-    """Print summary of results system test coverage."""
-    print("\n" + "=" * 60)
-    print("RESULTS SYSTEM TEST COVERAGE SUMMARY")
-    print("=" * 60)
-    print("✓ Student Results Viewing (Positive & Negative)")
-    print("✓ Lecturer Results Overview (Positive & Negative)")
-    print("✓ Exam Finished Page (Positive & Negative)")
-    print("✓ Auto-Save Functionality (Positive & Negative)")
-    print("✓ Integration Tests")
-    print("=" * 60)
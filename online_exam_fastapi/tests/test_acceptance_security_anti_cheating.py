@@ -13,352 +13,240 @@ These tests validate acceptance criteria for:
 - SCRUM-107: Activity Analytics and Automatic Flagging
 """
 
-import sys
-from pathlib import Path
-
 import pytest
-from fastapi.testclient import TestClient
-from sqlmodel import Session
 
+# Statuses accepted while an anti-cheating endpoint may not exist yet
+OK_STATUSES = frozenset({200, 401, 404, 405})
+
+
+@pytest.fixture(scope="module")
+def exam_start_response(_session_client):
+    """Fetch the exam start page once for all of the anti-cheating markup checks."""
+    return _session_client.get("/exam/1/start")
+
+
+@pytest.fixture(scope="module")
+def cached_get(_session_client):
+    """Return a GET helper that fetches each anonymous URL at most once per module."""
+    responses = {}
 
-def _ensure_app_on_path():
-    repo_root = Path(__file__).resolve().parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-    return repo_root
+    def _get(url):
+        if url not in responses:
+            responses[url] = _session_client.get(url)
+        return responses[url]
 
+    return _get
 
-# Ensure app is on path before importing
-_ensure_app_on_path()
+
+@pytest.fixture(scope="module")
+def exam_start_body(exam_start_response):
+    """Lowercased start page text, computed once; None when the page did not render."""
+    if exam_start_response.status_code != 200:
+        return None
+    return exam_start_response.text.lower()
 
 
 @pytest.fixture
-def db_session():
-    """Create a database session for testing."""
-    from app.database import create_db_and_tables, engine
-    
-    create_db_and_tables()
-    with Session(engine) as session:
-        yield session
+def start_page_body(exam_start_response, exam_start_body):
+    """Start page text for the content checks; skips during setup until the page renders."""
+    assert exam_start_response.status_code in OK_STATUSES  # Endpoint may not exist yet
+    # Content can only be checked once the endpoint exists
+    if exam_start_body is None:
+        pytest.skip("endpoint not implemented")
+    return exam_start_body
+
+
+def _assert_start_page_mentions(body, needles):
+    """Check that the rendered start page mentions one of needles."""
+    if not needles:
+        return
+    assert any(needle in body for needle in needles)
 
 
 class TestDisableRightClickContextMenu:
     """SCRUM-98: Disable Right-Click Context Menu - Acceptance Tests"""
 
-    def test_exam_page_disables_right_click_context_menu(self, client, db_session):
+    def test_exam_page_disables_right_click_context_menu(self, start_page_body):
         """Acceptance: Right-click context menu is disabled on exam pages."""
         # Given: An exam page is loaded
         # When: User attempts to right-click
-        response = client.get("/exam/1/start")
-        
         # Then: Page should include JavaScript to disable context menu
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
-        # Check if page contains context menu disabling code (only if endpoint exists)
-        if response.status_code == 200:
-            assert "contextmenu" in response.text.lower() or "preventDefault" in response.text.lower()
-
-    def test_context_menu_disabled_in_exam_taking_interface(self, client, db_session):
-        """Acceptance: Context menu is disabled during exam taking."""
-        # Given: Student is taking an exam
-        # When: Student right-clicks on exam content
-        response = client.get("/exam/1/take")
-        
-        # Then: Context menu should not appear
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
+        _assert_start_page_mentions(start_page_body, ("contextmenu", "preventdefault"))
 
 
 class TestBlockCopyPasteKeyboardShortcut:
     """SCRUM-99: Block Copy/Paste Keyboard Shortcut - Acceptance Tests"""
 
-    def test_exam_page_blocks_copy_shortcut(self, client, db_session):
-        """Acceptance: Ctrl+C (Copy) shortcut is blocked on exam pages."""
+    @pytest.mark.parametrize(
+        "needles",
+        [("copy", "ctrl+c"), ("paste", "ctrl+v"), ()],
+        ids=["copy", "paste", "cut"],
+    )
+    def test_exam_page_blocks_clipboard_shortcuts(self, start_page_body, needles):
+        """Acceptance: Ctrl+C / Ctrl+V / Ctrl+X shortcuts are blocked on exam pages."""
         # Given: An exam page is loaded
-        # When: User attempts Ctrl+C
-        response = client.get("/exam/1/start")
-        
-        # Then: Page should include JavaScript to block copy shortcut
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
-        # Check if page contains copy blocking code (only if endpoint exists)
-        if response.status_code == 200:
-            assert "copy" in response.text.lower() or "ctrl+c" in response.text.lower()
-
-    def test_exam_page_blocks_paste_shortcut(self, client, db_session):
-        """Acceptance: Ctrl+V (Paste) shortcut is blocked on exam pages."""
-        # Given: An exam page is loaded
-        # When: User attempts Ctrl+V
-        response = client.get("/exam/1/start")
-        
-        # Then: Page should include JavaScript to block paste shortcut
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
-        # Check if page contains paste blocking code (only if endpoint exists)
-        if response.status_code == 200:
-            assert "paste" in response.text.lower() or "ctrl+v" in response.text.lower()
-
-    def test_exam_page_blocks_cut_shortcut(self, client, db_session):
-        """Acceptance: Ctrl+X (Cut) shortcut is blocked on exam pages."""
-        # Given: An exam page is loaded
-        # When: User attempts Ctrl+X
-        response = client.get("/exam/1/start")
-        
-        # Then: Page should include JavaScript to block cut shortcut
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
+        # When: User attempts a clipboard shortcut
+        # Then: Page should include JavaScript to block it
+        _assert_start_page_mentions(start_page_body, needles)
 
 
 class TestDisableTextSelection:
     """SCRUM-100: Disable Text Selection - Acceptance Tests"""
 
-    def test_exam_page_disables_text_selection(self, client, db_session):
+    def test_exam_page_disables_text_selection(self, start_page_body):
         """Acceptance: Text selection is disabled on exam pages."""
         # Given: An exam page is loaded
         # When: User attempts to select text
-        response = client.get("/exam/1/start")
-        
         # Then: Page should include CSS/JS to disable text selection
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
-        # Check if page contains text selection disabling code (only if endpoint exists)
-        if response.status_code == 200:
-            assert "selectstart" in response.text.lower() or "user-select" in response.text.lower()
-
-    def test_text_selection_disabled_in_exam_questions(self, client, db_session):
-        """Acceptance: Text selection is disabled for exam questions."""
-        # Given: Student is viewing exam questions
-        # When: Student attempts to select question text
-        response = client.get("/exam/1/questions")
-        
-        # Then: Text selection should be disabled
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
+        _assert_start_page_mentions(start_page_body, ("selectstart", "user-select"))
 
 
 class TestBlockDeveloperToolsKeyboardShortcuts:
     """SCRUM-101: Block Developer Tools Keyboard Shortcuts - Acceptance Tests"""
 
-    def test_exam_page_blocks_f12_shortcut(self, client, db_session):
-        """Acceptance: F12 (Developer Tools) shortcut is blocked on exam pages."""
+    @pytest.mark.parametrize(
+        "needles",
+        [("f12", "keycode"), (), ()],
+        ids=["f12", "ctrl-shift-i", "ctrl-shift-j"],
+    )
+    def test_exam_page_blocks_devtools_shortcuts(self, start_page_body, needles):
+        """Acceptance: F12 / Ctrl+Shift+I / Ctrl+Shift+J shortcuts are blocked."""
         # Given: An exam page is loaded
-        # When: User attempts F12
-        response = client.get("/exam/1/start")
-        
-        # Then: Page should include JavaScript to block F12
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
-        # Check if page contains F12 blocking code (only if endpoint exists)
-        if response.status_code == 200:
-            assert "f12" in response.text.lower() or "keycode" in response.text.lower()
-
-    def test_exam_page_blocks_ctrl_shift_i_shortcut(self, client, db_session):
-        """Acceptance: Ctrl+Shift+I (Developer Tools) shortcut is blocked."""
-        # Given: An exam page is loaded
-        # When: User attempts Ctrl+Shift+I
-        response = client.get("/exam/1/start")
-        
-        # Then: Page should include JavaScript to block Ctrl+Shift+I
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
-
-    def test_exam_page_blocks_ctrl_shift_j_shortcut(self, client, db_session):
-        """Acceptance: Ctrl+Shift+J (Console) shortcut is blocked."""
-        # Given: An exam page is loaded
-        # When: User attempts Ctrl+Shift+J
-        response = client.get("/exam/1/start")
-        
-        # Then: Page should include JavaScript to block Ctrl+Shift+J
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
+        # When: User attempts a developer tools shortcut
+        # Then: Page should include JavaScript to block it
+        _assert_start_page_mentions(start_page_body, needles)
 
 
 class TestDetectTabWindowSwitching:
     """SCRUM-102: Detect Tab/Window Switching - Acceptance Tests"""
 
-    def test_system_detects_tab_switching(self, client, db_session):
+    def test_system_detects_tab_switching(self, start_page_body):
         """Acceptance: System detects when student switches browser tabs."""
         # Given: Student is taking an exam
         # When: Student switches to another tab
         # Then: System should log the tab switch event
         # This would typically be tested via JavaScript event listeners
-        response = client.get("/exam/1/start")
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
-        # Check if page contains visibility change detection (only if endpoint exists)
-        if response.status_code == 200:
-            assert "visibilitychange" in response.text.lower() or "blur" in response.text.lower()
+        _assert_start_page_mentions(start_page_body, ("visibilitychange", "blur"))
 
-    def test_tab_switch_logged_to_database(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_tab_switch_logged_to_database(self):
         """Acceptance: Tab switch events are logged to database."""
         # Given: Activity logging system exists
-        _ensure_app_on_path()
-        from app.models import ExamActivityLog
         # When: Tab switch is detected
         # Then: Activity log entry should be created
-        # This is a placeholder - actual implementation would create log entry
-        assert True  # Placeholder for actual database logging test
 
-    def test_system_detects_window_switching(self, client, db_session):
+    def test_system_detects_window_switching(self, exam_start_response):
         """Acceptance: System detects when student switches windows."""
         # Given: Student is taking an exam
         # When: Student switches to another window
         # Then: System should log the window switch event
-        response = client.get("/exam/1/start")
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
+        assert exam_start_response.status_code in OK_STATUSES  # Endpoint may not exist yet
 
 
 class TestEncourageFullscreenMode:
     """SCRUM-103: Encourage Fullscreen Mode - Acceptance Tests"""
 
-    def test_exam_page_prompts_fullscreen_mode(self, client, db_session):
+    def test_exam_page_prompts_fullscreen_mode(self, start_page_body):
         """Acceptance: Exam page prompts student to enter fullscreen mode."""
         # Given: Student starts an exam
         # When: Exam page loads
-        response = client.get("/exam/1/start")
-        
         # Then: Page should prompt for fullscreen mode
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet
-        # Check if page contains fullscreen prompt (only if endpoint exists)
-        if response.status_code == 200:
-            assert "fullscreen" in response.text.lower() or "requestfullscreen" in response.text.lower()
-
-    def test_fullscreen_prompt_displayed_before_exam_starts(self, client, db_session):
-        """Acceptance: Fullscreen prompt is displayed before exam starts."""
-        # Given: Student is about to start exam
-        # When: Pre-exam page loads
-        response = client.get("/exam/1/prepare")
-        
-        # Then: Fullscreen prompt should be visible
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet or response.status_code == 404
+        _assert_start_page_mentions(start_page_body, ("fullscreen", "requestfullscreen"))
 
 
 class TestLogSuspiciousActivitiesToDatabase:
     """SCRUM-105: Log Suspicious Activities to Database - Acceptance Tests"""
 
-    def test_tab_switch_activity_logged(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_tab_switch_activity_logged(self):
         """Acceptance: Tab switch activity is logged to database."""
         # Given: Activity logging system exists
-        _ensure_app_on_path()
-        from app.models import ExamActivityLog
         # When: Tab switch is detected
         # Then: Activity log entry should be created with timestamp and user info
-        # Placeholder for actual implementation
-        assert True
 
-    def test_copy_attempt_activity_logged(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_copy_attempt_activity_logged(self):
         """Acceptance: Copy attempt activity is logged to database."""
         # Given: Activity logging system exists
         # When: Copy attempt is detected
         # Then: Activity log entry should be created
-        assert True
 
-    def test_developer_tools_access_activity_logged(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_developer_tools_access_activity_logged(self):
         """Acceptance: Developer tools access attempt is logged to database."""
         # Given: Activity logging system exists
         # When: Developer tools access is detected
         # Then: Activity log entry should be created
-        assert True
 
-    def test_activity_log_contains_timestamp(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_activity_log_contains_timestamp(self):
         """Acceptance: Activity log entries contain accurate timestamps."""
         # Given: Activity logging system exists
         # When: Activity is logged
         # Then: Log entry should include timestamp
-        assert True
 
-    def test_activity_log_contains_user_information(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_activity_log_contains_user_information(self):
         """Acceptance: Activity log entries contain user information."""
         # Given: Activity logging system exists
         # When: Activity is logged
         # Then: Log entry should include user ID and username
-        assert True
 
 
 class TestLecturerDashboardViewActivityLogs:
     """SCRUM-106: Lecturer Dashboard to View Activity Logs - Acceptance Tests"""
 
-    def test_lecturer_can_access_activity_logs_dashboard(self, client, db_session):
+    def test_lecturer_can_access_activity_logs_dashboard(self, cached_get):
         """Acceptance: Lecturer can access activity logs dashboard."""
-        # Given: A lecturer is logged in
-        _ensure_app_on_path()
-        from app.models import User
-        import uuid
-        unique_id = uuid.uuid4().hex[:8]
-        lecturer = User(name="Lecturer One", email=f"lecturer-{unique_id}@example.com", password_hash="hash", role="lecturer")
-        db_session.add(lecturer)
-        db_session.commit()
-        
-        # When: Lecturer navigates to activity logs
-        response = client.get("/lecturer/activity-logs")
+        # When: The activity logs page is requested
+        response = cached_get("/lecturer/activity-logs")
         
         # Then: Activity logs dashboard should be displayed
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet or response.status_code == 401
-
-    def test_lecturer_can_view_all_student_activities(self, client, db_session):
-        """Acceptance: Lecturer can view all student activities."""
-        # Given: Activity logs exist and lecturer is logged in
-        # When: Lecturer views activity logs
-        response = client.get("/lecturer/activity-logs")
-        
-        # Then: All student activities should be displayed
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet or response.status_code == 401
-
-    def test_lecturer_can_filter_activities_by_student(self, client, db_session):
-        """Acceptance: Lecturer can filter activities by specific student."""
-        # Given: Activity logs exist
-        # When: Lecturer filters by student ID
-        response = client.get("/lecturer/activity-logs?student_id=1")
-        
-        # Then: Only that student's activities should be displayed
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet or response.status_code == 401
-
-    def test_lecturer_can_filter_activities_by_exam(self, client, db_session):
-        """Acceptance: Lecturer can filter activities by specific exam."""
-        # Given: Activity logs exist
-        # When: Lecturer filters by exam ID
-        response = client.get("/lecturer/activity-logs?exam_id=1")
-        
-        # Then: Only activities for that exam should be displayed
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet or response.status_code == 401
-
-    def test_lecturer_can_view_activity_details(self, client, db_session):
-        """Acceptance: Lecturer can view detailed information for each activity."""
-        # Given: Activity logs exist
-        # When: Lecturer clicks on an activity
-        response = client.get("/lecturer/activity-logs/1")
-        
-        # Then: Detailed activity information should be displayed
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet or response.status_code == 401
+        assert response.status_code in OK_STATUSES  # Endpoint may not exist yet
 
 
 class TestActivityAnalyticsAndAutomaticFlagging:
     """SCRUM-107: Activity Analytics and Automatic Flagging - Acceptance Tests"""
 
-    def test_system_calculates_suspicious_activity_score(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_system_calculates_suspicious_activity_score(self):
         """Acceptance: System calculates suspicious activity score for each student."""
         # Given: Multiple activities are logged for a student
         # When: System analyzes activities
         # Then: Suspicious activity score should be calculated
-        assert True
 
-    def test_system_automatically_flags_high_risk_students(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_system_automatically_flags_high_risk_students(self):
         """Acceptance: System automatically flags students with high suspicious activity."""
         # Given: Student has high suspicious activity score
         # When: System analyzes activities
         # Then: Student should be automatically flagged
-        assert True
 
-    def test_lecturer_can_view_flagged_students(self, client, db_session):
-        """Acceptance: Lecturer can view list of flagged students."""
-        # Given: Flagged students exist
-        # When: Lecturer views flagged students
-        response = client.get("/lecturer/flagged-students")
-        
-        # Then: List of flagged students should be displayed
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet or response.status_code == 401
-
-    def test_system_provides_activity_statistics(self, client, db_session):
-        """Acceptance: System provides activity statistics and analytics."""
-        # Given: Activity logs exist
-        # When: Lecturer views analytics dashboard
-        response = client.get("/lecturer/analytics")
-        
-        # Then: Statistics and analytics should be displayed
-        assert response.status_code in [200, 404, 405, 401]  # Endpoint may not exist yet or response.status_code == 401
-
-    def test_system_tracks_multiple_suspicious_events(self, client, db_session):
+    @pytest.mark.skip(reason="pending implementation")
+    def test_system_tracks_multiple_suspicious_events(self):
         """Acceptance: System tracks multiple types of suspicious events."""
         # Given: Various suspicious activities occur
         # When: System analyzes activities
         # Then: All suspicious events should be tracked and scored
-        assert True
+
+
+class TestAntiCheatingEndpointsReachable:
+    """Status checks for anti-cheating pages that have no content assertions yet."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/exam/1/take",  # SCRUM-98: context menu disabled while taking the exam
+            "/exam/1/questions",  # SCRUM-100: question text not selectable
+            "/exam/1/prepare",  # SCRUM-103: fullscreen prompt before the exam starts
+            "/lecturer/activity-logs",  # SCRUM-106: all student activities
+            "/lecturer/activity-logs?student_id=1",  # SCRUM-106: filter by student
+            "/lecturer/activity-logs?exam_id=1",  # SCRUM-106: filter by exam
+            "/lecturer/activity-logs/1",  # SCRUM-106: activity details
+            "/lecturer/flagged-students",  # SCRUM-107: flagged students
+            "/lecturer/analytics",  # SCRUM-107: activity statistics
+        ],
+    )
+    def test_endpoint_reachable(self, cached_get, url):
+        """Acceptance: Each page responds with an expected status (endpoint may not exist yet)."""
+        assert cached_get(url).status_code in OK_STATUSES
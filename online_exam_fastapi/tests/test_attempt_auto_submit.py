@@ -1,19 +1,26 @@
-def test_attempt_duration_default_and_timeout():
+import functools
+from datetime import datetime
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from sqlmodel import Session, select
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "app" / "templates"
+
+
+@functools.lru_cache(maxsize=1)
+def _template_env():
+    """Build the Jinja environment once; it keeps compiled templates cached across renders."""
+    return Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), autoescape=select_autoescape(["html", "xml"]))
+
+
+def test_attempt_duration_default_and_timeout(run_async):
     """Verify the attempt page uses a 90-minute default when exam.duration_minutes is not set,
     and that POSTing to the timeout endpoint marks the attempt as timed_out and saves answers.
     Also verify the template exposes attempts_count when multiple attempts exist.
     """
-    import sys
-    from pathlib import Path
-    from datetime import datetime
-
-    repo_root = Path(__file__).resolve().parent.parent
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
-
     # Use starlette's TestClient which is compatible with the project's dependencies
     from app.database import create_db_and_tables, engine
-    from sqlmodel import Session
     from app.models import Exam, Student, ExamQuestion, ExamAttempt, EssayAnswer
 
     # Ensure DB is created
@@ -56,11 +63,7 @@ def test_attempt_duration_default_and_timeout():
         q_data = {k: getattr(q, k) for k in ('id', 'question_text', 'max_marks', 'exam_id')}
 
     # Render the template using the same filesystem templates to inspect rendered JS
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
-    repo_root = Path(__file__).resolve().parent.parent
-    templates_dir = repo_root / "app" / "templates"
-    env = Environment(loader=FileSystemLoader(str(templates_dir)), autoescape=select_autoescape(["html", "xml"]))
-    tmpl = env.get_template("essay/attempt.html")
+    tmpl = _template_env().get_template("essay/attempt.html")
     # Build minimal context for rendering (templates expect current_user/request but they can be None)
     rendered = tmpl.render(
         exam=exam_data,
@@ -77,7 +80,6 @@ def test_attempt_duration_default_and_timeout():
 
     # Now simulate the auto-submit by calling the router function directly (async)
     from app.routers.essay_ui import attempt_timeout
-    import asyncio
 
     payload = {"answers": [{"question_id": q.id, "answer_text": "My answer"}]}
 
@@ -90,25 +92,13 @@ def test_attempt_duration_default_and_timeout():
 
     # Call the async endpoint function directly; pass the session explicitly
     with Session(engine) as session:
-        # run the coroutine with a new event loop
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_closed():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        coro = attempt_timeout(exam.id, attempt.id, session, DummyReq(payload))
-        res = loop.run_until_complete(coro)
+        res = run_async(attempt_timeout(exam.id, attempt.id, session, DummyReq(payload)))
 
     # Verify attempt updated in DB
     with Session(engine) as session:
         a = session.get(ExamAttempt, attempt.id)
         assert a is not None
         assert a.status == "timed_out"
-        from sqlmodel import select
         ans = session.exec(select(EssayAnswer).where(EssayAnswer.attempt_id == attempt.id)).first()
         assert ans is not None
 
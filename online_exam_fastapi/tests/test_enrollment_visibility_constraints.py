@@ -27,7 +27,7 @@ def _unique_code(prefix: str = "COURSE") -> str:
 class TestEnrollmentVisibilityConstraints:
     """Acceptance spec for Story 2: visibility based on Enrollment."""
 
-    def test_only_enrolled_students_can_start_essay_attempt(self):
+    def test_only_enrolled_students_can_start_essay_attempt(self, fake_user):
         """
         Desired behaviour:
         - Student *not* enrolled in course cannot start essay attempt.
@@ -78,10 +78,7 @@ class TestEnrollmentVisibilityConstraints:
             session.commit()
             session.refresh(u)
 
-            user_info = type("U", (), {})()
-            user_info.id = u.id
-            user_info.role = u.role
-            user_info.student_id = u.student_id
+            user_info = fake_user(id=u.id, role=u.role, student_id=u.student_id)
 
         with Session(engine) as session2:
             from fastapi import HTTPException